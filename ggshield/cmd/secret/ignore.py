@@ -83,6 +83,5 @@ def ignore_last_found(config: Config, cache: Cache) -> int:
     in the local .gitguardian.yaml config file so that they are ignored on next run
     Secrets are added as `hash`
     """
-    for secret in cache.last_found_secrets:
-        config.add_ignored_match(secret)
+    config.add_ignored_matches(cache.last_found_secrets)
     return len(cache.last_found_secrets)
@@ -1,4 +1,6 @@
+import json
 import logging
+import re
 import time
 from typing import Optional, Tuple
 
@@ -7,11 +9,9 @@ import requests
 from ggshield import __version__
 from ggshield.core.dirs import get_cache_dir
 
-from .config.utils import load_yaml_dict, save_yaml_dict
-
 
 logger = logging.getLogger(__name__)
-CACHE_FILE = get_cache_dir() / "update_check.yaml"
+CACHE_FILE = get_cache_dir() / "update_check.json"
 
 CHECK_AT_KEY = "check-at"
 
@@ -19,18 +19,32 @@ CHECK_AT_KEY = "check-at"
 # Use a short timeout to prevent blocking
 CHECK_TIMEOUT = 5
 
+# Match a release tag name, like "v1.2.3"
+_TAG_RX = re.compile(r"v(\d+(?:\.\d+)*)")
+
 
 def _split_version(version: str) -> Tuple[int, ...]:
-    return tuple([int(x) for x in version.split(".")])
+    return tuple(map(int, version.split(".")))
+
+
+def _parse_tag_name(tag_name: str) -> str:
+    """Returns the version from a release tag name, raises ValueError if `tag_name` is
+    not a release tag"""
+    match = _TAG_RX.fullmatch(tag_name)
+    if match is None:
+        raise ValueError(f"Unexpected tag name: {tag_name!r}")
+    return match.group(1)
 
 
 def load_last_check_time() -> Optional[float]:
     """Returns the last time we checked, or None if not available"""
     try:
-        cached_data = load_yaml_dict(CACHE_FILE)
-        if cached_data is None:
+        try:
+            text = CACHE_FILE.read_text()
+        except FileNotFoundError:
             # File does not exist, do not log any warning
             return None
+        cached_data = json.loads(text)
         return float(cached_data[CHECK_AT_KEY])
     except Exception as e:
         logger.warning("Could not load cached latest version: %s", repr(e))
@@ -39,7 +53,8 @@ def load_last_check_time() -> Optional[float]:
 
 def save_last_check_time(check_at: float) -> None:
     """Store the last time we checked"""
-    save_yaml_dict({CHECK_AT_KEY: check_at}, CACHE_FILE)
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps({CHECK_AT_KEY: check_at}))
 
 
 def check_for_updates() -> Optional[str]:
@@ -107,7 +122,7 @@ def check_for_updates() -> Optional[str]:
 
     try:
         data = resp.json()
-        latest_version: str = data["tag_name"][1:]
+        latest_version = _parse_tag_name(data["tag_name"])
 
         current_version_split = _split_version(__version__)
         latest_version_split = _split_version(latest_version)
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, cast
@@ -62,6 +61,18 @@ class InstanceConfig:
         )
 
 
+def _copy_auth_config_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a copy of `data` where the instance dicts can be modified without affecting
+    `data`. Only the root dict, the instance list and the instance dicts are copied:
+    deep-copying the whole tree is not necessary.
+    """
+    data = dict(data)
+    if "instances" in data:
+        data["instances"] = [dict(x) for x in data["instances"]]
+    return data
+
+
 def prepare_auth_config_dict_for_parse(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Since we support only one account for now, turn instances[].accounts keys into a
@@ -72,7 +83,7 @@ def prepare_auth_config_dict_for_parse(data: Dict[str, Any]) -> Dict[str, Any]:
     We replace `-` with `_` for compatibility reasons.
     """
     replace_dash_in_keys(data)
-    data = deepcopy(data)
+    data = _copy_auth_config_dict(data)
     try:
         instances = data["instances"]
     except KeyError:
@@ -93,7 +104,7 @@ def prepare_auth_config_dict_for_save(data: Dict[str, Any]) -> Dict[str, Any]:
     Does the opposite of `prepare_auth_config_dict_for_parse`: turn the
     instances[].account key into instances[].accounts keys.
     """
-    data = deepcopy(data)
+    data = _copy_auth_config_dict(data)
     try:
         instances = data["instances"]
     except KeyError:
@@ -42,14 +42,16 @@ class Config:
 
     __slots__ = [
         "user_config",
-        "auth_config",
+        "_auth_config",
         "_cmdline_instance_name",
         "_config_path",
         "_dotenv_vars",
     ]
 
     user_config: UserConfig
-    auth_config: AuthConfig
+
+    # Loaded on first access, see the `auth_config` property
+    _auth_config: Optional[AuthConfig]
 
     # The instance name, if ggshield is invoked with `--instance`
     _cmdline_instance_name: Optional[str]
@@ -63,13 +65,25 @@ class Config:
 
     def __init__(self, config_path: Optional[Path] = None):
         self.user_config, self._config_path = UserConfig.load(config_path=config_path)
-        self.auth_config = AuthConfig.load()
+        self._auth_config = None
         self._cmdline_instance_name = None
         self._dotenv_vars = set()
 
     def save(self) -> None:
         self.user_config.save(self._config_path)
-        self.auth_config.save()
+        # No need to save the auth config if it has never been loaded
+        if self._auth_config is not None:
+            self._auth_config.save()
+
+    @property
+    def auth_config(self) -> AuthConfig:
+        """
+        The auth config. It is only loaded when needed, since many commands do not
+        use it.
+        """
+        if self._auth_config is None:
+            self._auth_config = AuthConfig.load()
+        return self._auth_config
 
     @property
     def config_path(self) -> Path:
@@ -192,6 +206,9 @@ class Config:
     def add_ignored_match(self, *args: Any, **kwargs: Any) -> None:
         return self.user_config.secret.add_ignored_match(*args, **kwargs)
 
+    def add_ignored_matches(self, *args: Any, **kwargs: Any) -> None:
+        return self.user_config.secret.add_ignored_matches(*args, **kwargs)
+
     @property
     def saas_api_url(self) -> str:
         """
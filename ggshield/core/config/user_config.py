@@ -3,8 +3,9 @@ import logging
 import re
 from dataclasses import field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import marshmallow_dataclass
 from marshmallow import ValidationError, post_load, pre_load
@@ -55,13 +56,24 @@ class SecretConfig(FilteredConfig):
         """
         Add secret to ignored_matches.
         """
-        for match in self.ignored_matches:
-            if match.match == secret.match:
+        self.add_ignored_matches([secret])
+
+    def add_ignored_matches(self, secrets: Iterable[IgnoredMatch]) -> None:
+        """
+        Add secrets to ignored_matches. Secrets which are already ignored are not added
+        again.
+        """
+        # Index ignored matches once instead of going through the whole list for each
+        # secret. Iterate in reverse order so that the first match wins.
+        ignored_matches_by_match = {x.match: x for x in reversed(self.ignored_matches)}
+        for secret in secrets:
+            match = ignored_matches_by_match.get(secret.match)
+            if match is None:
+                self.ignored_matches.append(secret)
+                ignored_matches_by_match[secret.match] = secret
+            elif not match.name:
                 # take the opportunity to name the ignored match
-                if not match.name:
-                    match.name = secret.name
-                return
-        self.ignored_matches.append(secret)
+                match.name = secret.name
 
     def dump_for_monitoring(self) -> str:
         return json.dumps(
@@ -320,9 +332,7 @@ class UserConfig(FilteredConfig):
 
     def to_config_dict(self) -> Dict[str, Any]:
         dct = self.to_dict()
-        default_dct = UserConfig.from_dict({}).to_dict()
-
-        dct = remove_common_dict_items(dct, default_dct)
+        dct = remove_common_dict_items(dct, _get_default_config_dict())
 
         dct["version"] = CURRENT_CONFIG_VERSION
 
@@ -390,6 +400,15 @@ UserConfig.SCHEMA = marshmallow_dataclass.class_schema(UserConfig)(
 )
 
 
+@lru_cache(None)
+def _get_default_config_dict() -> Dict[str, Any]:
+    """
+    Returns the dict of a default UserConfig. It never changes, so it is only created
+    once. Callers must not modify it.
+    """
+    return UserConfig.from_dict({}).to_dict()
+
+
 def _load_config_dict(
     config_path: Path, deprecation_messages: List[str]
 ) -> Dict[str, Any]:
@@ -1,5 +1,6 @@
+from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Union, overload
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Union, overload
 
 import yaml
 import yaml.parser
@@ -15,6 +16,25 @@ from ggshield.core.errors import UnexpectedError
 from ggshield.utils.git_shell import GitExecutableNotFound
 
 
+# Use the libyaml-based loader and dumper when PyYAML has been built with them, they
+# are much faster than the pure-Python implementations
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed YAML files, indexed by absolute path. Each entry also stores the modification
+# time and size of the file when it was parsed, so that a modified file is parsed again
+_yaml_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _reset_yaml_cache() -> None:
+    """Forget all parsed YAML files. Used by tests which replace the file system."""
+    _yaml_cache.clear()
+
+
 def replace_dash_in_keys(data: Union[List[Any], Dict[str, Any]]) -> Set[str]:
     """Replace '-' with '_' in data keys.
 
@@ -24,31 +44,49 @@ def replace_dash_in_keys(data: Union[List[Any], Dict[str, Any]]) -> Set[str]:
     Returns a set with the names of the renamed/removed dash keys."""
     dash_keys = set()
 
-    if isinstance(data, dict):
-        for key, value in list(data.items()):
-            dash_keys.update(replace_dash_in_keys(value))
-            if "-" in key:
-                dash_value = data.pop(key)
+    # Walk the data with an explicit stack instead of recursing
+    stack: List[Union[List[Any], Dict[str, Any]]] = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(x for x in node.values() if isinstance(x, (dict, list)))
+            # Most dicts do not contain any dash key: find the ones to rename first, so
+            # that these dicts are left untouched
+            for key in [x for x in node if "-" in x]:
+                dash_value = node.pop(key)
                 # If an underscore-version of the key exist, do not replace it
                 new_key = key.replace("-", "_")
-                if new_key not in data:
-                    data[new_key] = dash_value
+                if new_key not in node:
+                    node[new_key] = dash_value
                 dash_keys.add(key)
-    elif isinstance(data, list):
-        for element in data:
-            dash_keys.update(replace_dash_in_keys(element))
+        elif isinstance(node, list):
+            stack.extend(x for x in node if isinstance(x, (dict, list)))
 
     return dash_keys
 
 
 def load_yaml_dict(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Load the YAML dict stored in `path`. Returns None if `path` does not exist.
+
+    Parsed files are cached, the returned dict is always a copy the caller can modify.
+    """
     path = Path(path)
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return None
 
-    with path.open() as f:
+    cache_key = path.absolute()
+    cached = _yaml_cache.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return deepcopy(cached[2])
+
+    # Let the YAML reader decode the file itself: it detects the encoding from the BOM
+    # and defaults to UTF-8, whatever the locale
+    with path.open("rb") as f:
         try:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
         except (yaml.parser.ParserError, yaml.scanner.ScannerError) as e:
             message = f"{path} is not a valid YAML file:\n{str(e)}"
             raise ValueError(message)
@@ -56,18 +94,38 @@ def load_yaml_dict(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
     if not isinstance(data, dict):
         raise ValueError(f"{path} should be a dictionary.")
 
+    _yaml_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, deepcopy(data))
     return data
 
 
 def save_yaml_dict(data: Dict[str, Any], path: Union[str, Path]) -> None:
+    """
+    Save `data` as YAML in `path`.
+
+    The file is not written if its content would not change, to avoid touching its
+    modification time (which would also invalidate the parsed YAML cache).
+    """
     p = Path(path)
+    try:
+        content = yaml.dump(
+            data,
+            Dumper=_SafeDumper,
+            indent=2,
+            default_flow_style=False,
+            encoding="utf-8",
+        )
+    except Exception as e:
+        raise UnexpectedError(f"Failed to save config to {path}:\n{str(e)}") from e
+
+    try:
+        if p.read_bytes() == content:
+            return
+    except OSError:
+        pass
+
+    _yaml_cache.pop(p.absolute(), None)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w") as f:
-        try:
-            stream = yaml.dump(data, indent=2, default_flow_style=False)
-            f.write(stream)
-        except Exception as e:
-            raise UnexpectedError(f"Failed to save config to {path}:\n{str(e)}") from e
+    p.write_bytes(content)
 
 
 def get_auth_config_filepath() -> Path:
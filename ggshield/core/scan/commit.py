@@ -1,7 +1,8 @@
+from itertools import chain
 from pathlib import Path
 from typing import Callable, Iterable, Optional, Pattern, Sequence, Set
 
-from ggshield.utils.git_shell import git
+from ggshield.utils.git_shell import git_stream
 from ggshield.utils.itertools import batched
 from ggshield.utils.os import getenv_int
 
@@ -16,6 +17,7 @@ from .commit_utils import (
     get_file_sha_in_ref,
     get_file_sha_stage,
     parse_patch,
+    parse_patch_chunks,
 )
 from .scannable import Scannable
 
@@ -70,8 +72,8 @@ class Commit:
                         cmd.append(str(old_path))
                     cmd.append(str(path))
 
-                patch = git(cmd, cwd=cwd)
-                yield from parse_patch(sha, patch, exclusion_regexes)
+                chunks = git_stream(cmd, cwd=cwd)
+                yield from parse_patch_chunks(sha, chunks, exclusion_regexes)
 
         return Commit(sha, parser, info)
 
@@ -96,12 +98,12 @@ class Commit:
                 files_to_scan.add(path)
 
         def parser_merge(commit: "Commit") -> Iterable[Scannable]:
-            patch = git(
+            chunks = git_stream(
                 ["diff", "--staged", *PATCH_COMMON_ARGS, *files_to_scan], cwd=cwd
             )
-            yield from parse_patch(
+            yield from parse_patch_chunks(
                 STAGED_PREFIX,
-                DIFF_EMPTY_COMMIT_INFO_BLOCK + patch,
+                chain([DIFF_EMPTY_COMMIT_INFO_BLOCK.encode()], chunks),
                 exclusion_regexes,
             )
 
@@ -114,10 +116,10 @@ class Commit:
         cwd: Optional[Path] = None,
     ) -> "Commit":
         def parser(commit: "Commit") -> Iterable[Scannable]:
-            patch = git(["diff", "--staged"] + PATCH_COMMON_ARGS, cwd=cwd)
-            yield from parse_patch(
+            chunks = git_stream(["diff", "--staged"] + PATCH_COMMON_ARGS, cwd=cwd)
+            yield from parse_patch_chunks(
                 STAGED_PREFIX,
-                DIFF_EMPTY_COMMIT_INFO_BLOCK + patch,
+                chain([DIFF_EMPTY_COMMIT_INFO_BLOCK.encode()], chunks),
                 exclusion_regexes,
             )
 
@@ -1,9 +1,9 @@
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Optional, Pattern, Set, Tuple
+from typing import Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Union
 
-from ggshield.utils.files import is_path_excluded
+from ggshield.utils.files import combine_regexes, is_path_excluded
 from ggshield.utils.git_shell import Filemode, git
 
 from .scannable import Scannable
@@ -31,7 +31,15 @@ PATCH_COMMON_ARGS = [
 # area, where there is no commit info yet
 DIFF_EMPTY_COMMIT_INFO_BLOCK = """Author:   <>\nDate:  \n:"""
 
-_RX_HEADER_FILE_LINE_SEPARATOR = re.compile("[\n\0]:", re.MULTILINE)
+# Separates the file lines of a patch header. The first file line is preceded by "\n:",
+# the other ones by "\0:"
+_HEADER_FILE_LINE_SEPARATOR = "\0:"
+
+# Separates the patch header from the first diff
+_PATCH_HEADER_DIFF_SEPARATOR = b"\0diff "
+
+# Separates two diffs of a patch
+_DIFF_SEPARATOR = b"\ndiff "
 
 # Match the path in a "---a/file_path" or a "+++ b/file_path".
 # Note that for some reason, git sometimes append an \t at the end (happens with the
@@ -39,6 +47,25 @@ _RX_HEADER_FILE_LINE_SEPARATOR = re.compile("[\n\0]:", re.MULTILINE)
 OLD_NAME_RX = re.compile(r"^--- a/(.*?)\t?$", flags=re.MULTILINE)
 NEW_NAME_RX = re.compile(r"^\+\+\+ b/(.*?)\t?$", flags=re.MULTILINE)
 
+# Match the status letters at the end of the prefix of a raw patch header line, ignoring
+# the optional score
+_RX_PATCH_FILE_STATUS = re.compile(r" ([A-Z]+)\d*\Z")
+
+# Map status letters of raw patch header lines to file modes.
+#
+# There is one status letter per commit parent. In the case of a merge commit we must
+# look at all letters: if one parent is marked as D(eleted) and the other as M(odified)
+# then we use MODIFY as filemode because the end result contains modifications. To
+# ensure this, the order of the items matters: the first one found wins.
+_STATUS_TO_FILEMODE = {
+    "M": Filemode.MODIFY,  # modify
+    "C": Filemode.NEW,  # copy
+    "A": Filemode.NEW,  # add
+    "T": Filemode.NEW,  # type change
+    "R": Filemode.RENAME,  # rename
+    "D": Filemode.DELETE,  # delete
+}
+
 MULTI_PARENT_HUNK_HEADER_RX = re.compile(
     r"^(?P<at>@@+) (?P<from>-\d+(?:,\d+)?) .* (?P<to>\+\d+(?:,\d+)?) @@+$"
 )
@@ -62,6 +89,8 @@ class CommitScannable(Scannable):
     and PATCH_PREFIX respectively.
     """
 
+    __slots__ = ["_sha", "_path"]
+
     def __init__(
         self,
         sha: Optional[str],
@@ -111,6 +140,10 @@ class PatchFileInfo:
     Stores information about a file modified by a patch
     """
 
+    # There is one instance per file of each scanned commit. The fields have no default
+    # values, so declaring __slots__ by hand works with @dataclass.
+    __slots__ = ["old_path", "path", "mode"]
+
     # old_path is None unless filemode is RENAME or COPY
     old_path: Optional[Path]
     path: Path
@@ -125,7 +158,7 @@ class PatchFileInfo:
         details on the format.
         """
 
-        prefix, path, *rest = line.rstrip("\0").split("\0")
+        prefix, path, *rest = line.rstrip("\0").split("\0", 2)
 
         if rest:
             # If the line has a new path, it's a rename
@@ -146,29 +179,19 @@ class PatchFileInfo:
         # status_and_score is one or more status letters, followed by an optional
         # numerical score. We can ignore the score, but we need to check the status
         # letters.
-        status = prefix.rsplit(" ", 1)[-1].rstrip("0123456789")
-
-        # There is one status letter per commit parent. In the case of a non-merge
-        # commit the situation is simple: there is only one letter.
-        # In the case of a merge commit we must look at all letters: if one parent is
-        # marked as D(eleted) and the other as M(odified) then we use MODIFY as filemode
-        # because the end result contains modifications. To ensure this, the order of
-        # the `if` below matters.
-
-        if "M" in status:  # modify
-            mode = Filemode.MODIFY
-        elif "C" in status:  # copy
-            mode = Filemode.NEW
-        elif "A" in status:  # add
-            mode = Filemode.NEW
-        elif "T" in status:  # type change
-            mode = Filemode.NEW
-        elif "R" in status:  # rename
-            mode = Filemode.RENAME
-        elif "D" in status:  # delete
-            mode = Filemode.DELETE
-        else:
-            raise ValueError(f"Can't parse header line {line}: unknown status {status}")
+        match = _RX_PATCH_FILE_STATUS.search(prefix)
+        status = match.group(1) if match else ""
+
+        # Fast path for non-merge commits, which have a single status letter
+        mode = _STATUS_TO_FILEMODE.get(status)
+        if mode is None:
+            mode = next(
+                (y for x, y in _STATUS_TO_FILEMODE.items() if x in status), None
+            )
+            if mode is None:
+                raise ValueError(
+                    f"Can't parse header line {line}: unknown status {status}"
+                )
 
         return PatchFileInfo(old_path, new_path, mode)
 
@@ -189,7 +212,10 @@ class PatchHeader:
     @staticmethod
     def from_string(header: str) -> "PatchHeader":
         # First item returned by split() contains commit info and message, skip it
-        info, *lines = _RX_HEADER_FILE_LINE_SEPARATOR.split(header)
+        # Splitting with str methods is much faster than with a regular expression
+        info, *lines = header.replace("\n:", _HEADER_FILE_LINE_SEPARATOR).split(
+            _HEADER_FILE_LINE_SEPARATOR
+        )
         return PatchHeader(
             info,
             [PatchFileInfo.from_string(x) for x in lines],
@@ -257,55 +283,127 @@ def parse_patch(
     - The hunk starts with 3 "@" instead of 2. For a commit with N parents, there are
       actually N+1 "@" characters.
     """
-    if exclusion_regexes is None:
-        exclusion_regexes = set()
+    yield from parse_patch_chunks(sha, [patch.encode()], exclusion_regexes)
+
 
-    tokens = patch.split("\0diff ", 1)
-    if len(tokens) == 1:
+def parse_patch_chunks(
+    sha: Optional[str],
+    chunks: Iterable[bytes],
+    exclusion_regexes: Optional[Set[Pattern[str]]],
+) -> Iterable[Scannable]:
+    """
+    Same as parse_patch(), but the patch is received as UTF-8 encoded chunks, for
+    example from git_stream(). Each Scannable is produced as soon as its diff has been
+    received.
+
+    Exceptions raised while iterating over `chunks` are not turned into
+    PatchParseError.
+    """
+    # Paths of all the diffs are checked against all the exclusion regexes: combine
+    # them first
+    combined_exclusion_regexes = combine_regexes(exclusion_regexes or ())
+
+    parts = _split_patch(chunks)
+    header_str = next(parts, None)
+    if header_str is None:
         # No diff, we are done
         return
-    header_str, rest = tokens
 
     try:
         header = PatchHeader.from_string(header_str)
-
-        diffs = re.split(r"^diff ", rest, flags=re.MULTILINE)
-        for diff in diffs:
-            # Split diff into header and content
-            try:
-                # + 1 because we match the "\n" in "\n@@"
-                content_start = diff.index("\n@@") + 1
-            except ValueError:
-                # No content
-                continue
-            diff_header = diff[:content_start]
-            content = diff[content_start:]
-
-            # Find diff path in diff header
-            match = NEW_NAME_RX.search(diff_header)
-            if not match:
-                # Must have been deleted. find the old path in this case
-                match = OLD_NAME_RX.search(diff_header)
-                if not match:
-                    raise PatchParseError(
-                        f"Could not find old path in {repr(diff_header)}"
-                    )
-            path = Path(match.group(1))
-            if is_path_excluded(path, exclusion_regexes):
-                continue
-
-            file_info = next(x for x in header.files if x.path == path)
-
-            if content.startswith("@@@"):
-                content = convert_multi_parent_diff(content)
-
-            yield CommitScannable(sha, file_info.path, content, filemode=file_info.mode)
     except Exception as exc:
-        if sha:
-            msg = f"Could not parse patch (sha: {sha}): {exc}"
-        else:
-            msg = f"Could not parse patch: {exc}"
-        raise PatchParseError(msg)
+        raise _create_patch_parse_error(sha, exc)
+
+    for diff in parts:
+        try:
+            scannable = _parse_diff(sha, header, diff, combined_exclusion_regexes)
+        except Exception as exc:
+            raise _create_patch_parse_error(sha, exc)
+        if scannable is not None:
+            yield scannable
+
+
+def _split_patch(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Split a patch received as UTF-8 encoded chunks. Yields the patch header first, then
+    each diff, without its leading "diff ". Yields nothing if the patch contains no
+    diff.
+
+    Separators are searched in the raw bytes, only the parts are decoded. This is safe
+    because separators are ASCII: a UTF-8 multi-byte character cannot contain them.
+    """
+    separator = _PATCH_HEADER_DIFF_SEPARATOR
+    buffer = bytearray()
+    for chunk in chunks:
+        # Start searching a bit before the new chunk, in case the separator spans two
+        # chunks
+        search_start = max(len(buffer) - len(separator) + 1, 0)
+        buffer += chunk
+        start = 0
+        with memoryview(buffer) as view:
+            while (idx := buffer.find(separator, search_start)) != -1:
+                if separator is _PATCH_HEADER_DIFF_SEPARATOR:
+                    yield _decode_patch_part(view[start:idx])
+                    separator = _DIFF_SEPARATOR
+                else:
+                    # Keep the "\n" before "diff " with the previous diff
+                    yield _decode_patch_part(view[start : idx + 1])
+                start = search_start = idx + len(separator)
+        del buffer[:start]
+
+    if separator is _DIFF_SEPARATOR:
+        yield _decode_patch_part(buffer)
+
+
+def _decode_patch_part(data: Union[memoryview, bytearray]) -> str:
+    return str(data, "utf-8", errors="ignore")
+
+
+def _parse_diff(
+    sha: Optional[str],
+    header: PatchHeader,
+    diff: str,
+    exclusion_regexes: List[Pattern[str]],
+) -> Optional[CommitScannable]:
+    """
+    Parse a diff from a patch. Returns None if the diff has no content or if its path
+    is excluded.
+    """
+    # Split diff into header and content
+    try:
+        # + 1 because we match the "\n" in "\n@@"
+        content_start = diff.index("\n@@") + 1
+    except ValueError:
+        # No content
+        return None
+    diff_header = diff[:content_start]
+    content = diff[content_start:]
+
+    # Find diff path in diff header
+    match = NEW_NAME_RX.search(diff_header)
+    if not match:
+        # Must have been deleted. find the old path in this case
+        match = OLD_NAME_RX.search(diff_header)
+        if not match:
+            raise PatchParseError(f"Could not find old path in {repr(diff_header)}")
+    path = Path(match.group(1))
+    if is_path_excluded(path, exclusion_regexes):
+        return None
+
+    file_info = next(x for x in header.files if x.path == path)
+
+    if content.startswith("@@@"):
+        content = convert_multi_parent_diff(content)
+
+    return CommitScannable(sha, file_info.path, content, filemode=file_info.mode)
+
+
+def _create_patch_parse_error(sha: Optional[str], exc: Exception) -> PatchParseError:
+    if sha:
+        msg = f"Could not parse patch (sha: {sha}): {exc}"
+    else:
+        msg = f"Could not parse patch: {exc}"
+    return PatchParseError(msg)
 
 
 def convert_multi_parent_diff(content: str) -> str:
@@ -9,6 +9,8 @@ from .scannable import Scannable
 class File(Scannable):
     """Implementation of Scannable for files from the disk."""
 
+    __slots__ = ["_path"]
+
     def __init__(self, path: Union[str, Path]):
         super().__init__()
         self._path = Path(path)
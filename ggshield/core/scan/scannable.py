@@ -1,13 +1,15 @@
 import codecs
+import hashlib
 import logging
+import re
 import urllib.parse
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from io import SEEK_END, SEEK_SET
 from pathlib import Path
 from typing import BinaryIO, Optional, Tuple
 
 import charset_normalizer
-from charset_normalizer import CharsetMatch
 
 from ggshield.utils.git_shell import Filemode
 
@@ -20,6 +22,17 @@ logger = logging.getLogger(__name__)
 # need to look into it: it's too big.
 UTF8_TO_WORSE_OTHER_ENCODING_RATIO = 4
 
+# Maximum number of encodings kept by _detect_encoding()
+ENCODING_CACHE_MAX_SIZE = 1024
+
+# Encodings detected by charset_normalizer, indexed by a hash of the content. Used as an
+# LRU cache.
+_encoding_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+# Matches URLs which urlparse() would not return unchanged as their path: URLs with a
+# scheme, a netloc, params, a query or a fragment, or with characters urlparse() strips
+_RX_URL_NEEDS_PARSING = re.compile(r"[:;?#\t\r\n]|^(?://|[\x00-\x20])")
+
 
 class DecodeError(Exception):
     """
@@ -31,9 +44,38 @@ class DecodeError(Exception):
     pass
 
 
+def _detect_encoding(raw_document: bytes) -> Optional[str]:
+    """Returns the encoding of `raw_document`, or None if it cannot be determined.
+
+    Encoding detection is slow, and the same content is often scanned more than once, so
+    detected encodings are cached."""
+    if raw_document.isascii() and b"\0" not in raw_document:
+        # Shortcut: most source files are plain ASCII, no need to detect their encoding.
+        # Documents containing NUL bytes are excluded because they could be UTF-16 or
+        # UTF-32.
+        return "ascii"
+
+    key = hashlib.blake2b(raw_document, digest_size=16).digest()
+    encoding = _encoding_cache.get(key)
+    if encoding is not None:
+        _encoding_cache.move_to_end(key)
+        return encoding
+
+    charset_match = charset_normalizer.from_bytes(raw_document).best()
+    if charset_match is None:
+        return None
+    encoding = charset_match.encoding
+    _encoding_cache[key] = encoding
+    if len(_encoding_cache) > ENCODING_CACHE_MAX_SIZE:
+        _encoding_cache.popitem(last=False)
+    return encoding
+
+
 class Scannable(ABC):
     """Base class for content that can be scanned by GGShield"""
 
+    __slots__ = ["filemode", "_content", "_utf8_encoded_size"]
+
     def __init__(self, filemode: Filemode = Filemode.FILE):
         self.filemode = filemode
         self._content: Optional[str] = None
@@ -98,29 +140,27 @@ class Scannable(ABC):
 
     @staticmethod
     def _decode_bytes(
-        raw_document: bytes, charset_match: Optional[CharsetMatch] = None
+        raw_document: bytes, encoding: Optional[str] = None
     ) -> Tuple[str, int]:
-        """Low level helper function to decode bytes using `charset_match`. If
-        `charset_match` is not provided, tries to determine it itself.
+        """Low level helper function to decode bytes using `encoding`. If `encoding` is
+        not provided, tries to determine it itself.
 
         Returns a tuple of (decoded_content, utf8_encoded_size).
 
         Raises DecodeError if the document cannot be decoded."""
-        if charset_match is None:
-            charset_match = charset_normalizer.from_bytes(raw_document).best()
-            if charset_match is None:
+        if encoding is None:
+            encoding = _detect_encoding(raw_document)
+            if encoding is None:
                 # This means we were not able to detect the encoding
                 raise DecodeError
 
         # Special case for utf_8 + BOM: `bytes.decode()` does not skip the BOM, so do it
         # ourselves
-        if charset_match.encoding == "utf_8" and raw_document.startswith(
-            codecs.BOM_UTF8
-        ):
+        if encoding == "utf_8" and raw_document.startswith(codecs.BOM_UTF8):
             raw_document = raw_document[len(codecs.BOM_UTF8) :]
-        content = raw_document.decode(charset_match.encoding, errors="replace")
+        content = raw_document.decode(encoding, errors="replace")
 
-        if charset_match.encoding in {"utf_8", "ascii"}:
+        if encoding in {"utf_8", "ascii"}:
             # The document is already in UTF-8, no need to encode it as UTF-8 to
             # determine UTF-8 encoded size.
             utf8_encoded_size = len(raw_document)
@@ -152,22 +192,24 @@ class Scannable(ABC):
             # `max_utf8_encoded_size`, so bail out
             return True, None, None
 
-        # Determine the encoding
+        # Determine the encoding. The file is small enough to be read: use the same
+        # detection as _decode_bytes(), so that reading the content later on reuses
+        # the cached encoding instead of detecting it again.
         fp.seek(0, SEEK_SET)
-        charset_matches = charset_normalizer.from_fp(fp)
-        charset_match = charset_matches.best()
-        if charset_match is None:
+        raw_document = fp.read()
+        encoding = _detect_encoding(raw_document)
+        if encoding is None:
             raise DecodeError
 
-        logger.debug('filename="%s" charset=%s', fp.name, charset_match.encoding)
-        if charset_match.encoding in {"utf_8", "ascii"}:
+        logger.debug('filename="%s" charset=%s', fp.name, encoding)
+        if encoding in {"utf_8", "ascii"} and byte_size > max_utf8_encoded_size:
             # Shortcut: the content is already in UTF-8 (or ASCII, which is a subset of
-            # utf-8), no need to decode anything
-            return byte_size > max_utf8_encoded_size, None, byte_size
+            # utf-8), no need to decode it to know it is too long
+            return True, None, byte_size
 
-        # We can't know if the file is longer without reading its content, do it now
-        fp.seek(0, SEEK_SET)
-        content, utf8_encoded_size = Scannable._decode_bytes(fp.read(), charset_match)
+        # The bytes are already in memory: decode them, so that the content does not
+        # have to be read again
+        content, utf8_encoded_size = Scannable._decode_bytes(raw_document, encoding)
         logger.debug('filename="%s" utf8_encoded_size=%d', fp.name, utf8_encoded_size)
         if utf8_encoded_size > max_utf8_encoded_size:
             return True, None, utf8_encoded_size
@@ -179,6 +221,8 @@ class Scannable(ABC):
 class StringScannable(Scannable):
     """Implementation of Scannable for content already loaded in memory"""
 
+    __slots__ = ["_url", "_path"]
+
     def __init__(self, url: str, content: str, filemode: Filemode = Filemode.FILE):
         super().__init__(filemode)
         self._url = url
@@ -201,8 +245,12 @@ class StringScannable(Scannable):
     @property
     def path(self) -> Path:
         if self._path is None:
-            result = urllib.parse.urlparse(self._url)
-            self._path = Path(result.path)
+            if _RX_URL_NEEDS_PARSING.search(self._url):
+                url_path = urllib.parse.urlparse(self._url).path
+            else:
+                # Plain path, no need to parse it
+                url_path = self._url
+            self._path = Path(url_path)
         return self._path
 
     def is_longer_than(self, max_utf8_encoded_size: int) -> bool:
@@ -1,6 +1,7 @@
+import re
 from enum import Enum, auto
 from pathlib import Path, PurePath, PurePosixPath
-from typing import List, Pattern, Set, Union
+from typing import Dict, Iterable, List, Pattern, Set, Union
 from urllib.parse import quote
 
 from ggshield.utils._binary_extensions import BINARY_EXTENSIONS
@@ -28,8 +29,25 @@ class ListFilesMode(Enum):
     ALL = auto()
 
 
+def combine_regexes(regexes: Iterable[Pattern[str]]) -> List[Pattern[str]]:
+    """
+    Combine `regexes` into as few regexes as possible: one per set of flags.
+
+    Searching a string with the returned regexes gives the same result as searching it
+    with `regexes`, but it is faster when there are many of them, because each string
+    is only scanned once per returned regex.
+    """
+    patterns_by_flags: Dict[int, List[str]] = {}
+    for regex in regexes:
+        patterns_by_flags.setdefault(regex.flags, []).append(f"(?:{regex.pattern})")
+    return [
+        re.compile("|".join(patterns), flags)
+        for flags, patterns in patterns_by_flags.items()
+    ]
+
+
 def is_path_excluded(
-    path: Union[str, Path], exclusion_regexes: Set[Pattern[str]]
+    path: Union[str, Path], exclusion_regexes: Iterable[Pattern[str]]
 ) -> bool:
     path = Path(path)
     if path.is_dir():
@@ -51,6 +69,7 @@ def list_files(
 
     Note: only plain files are returned, not directories.
     """
+    combined_exclusion_regexes = combine_regexes(exclusion_regexes)
     targets: Set[Path] = set()
     for path in paths:
         if path.is_file():
@@ -77,7 +96,7 @@ def list_files(
 
             for file_path in _targets:
                 if not file_path.is_dir() and not is_path_excluded(
-                    file_path, exclusion_regexes
+                    file_path, combined_exclusion_regexes
                 ):
                     targets.add(file_path)
     return targets
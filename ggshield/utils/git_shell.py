@@ -2,11 +2,14 @@ import logging
 import os
 import re
 import subprocess
+import tempfile
+import threading
+import time
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
 from shutil import which
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar, Union
 
 from ggshield.utils.os import getenv_int
 
@@ -16,8 +19,13 @@ EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
 
 COMMAND_TIMEOUT = getenv_int("GG_GIT_TIMEOUT", 45)
 
+# Maximum size of the chunks read from git by git_stream()
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class GitError(Exception):
     pass
@@ -180,6 +188,36 @@ def check_git_dir(wd: Optional[Union[str, Path]] = None) -> None:
         raise NotAGitDirectory()
 
 
+def _get_git_env(ignore_git_config: bool) -> Dict[str, str]:
+    """Returns the environment to use to run git commands"""
+    env = os.environ.copy()
+    # Ensure git messages are in English
+    env["LANG"] = "C"
+    # Ensure git behavior is not affected by the user git configuration, but give us a
+    # way to set some configuration (useful for safe.directory)
+    if ignore_git_config:
+        env["GIT_CONFIG_GLOBAL"] = os.getenv("GG_GIT_CONFIG", "")
+        env["GIT_CONFIG_SYSTEM"] = ""
+    return env
+
+
+def _check_git_error(
+    command: List[str], exc: subprocess.CalledProcessError, log_stderr: bool
+) -> None:
+    """Logs the stderr of a failed git command. Raises GitError if we can provide a
+    better error message than the one from `exc`"""
+    stderr = exc.stderr.decode("utf-8", errors="ignore")
+    if log_stderr:
+        logger.error("command=%s, stderr=%s", command, stderr)
+    if "detected dubious ownership in repository" in stderr:
+        raise GitError(
+            "Git command failed because of a dubious ownership in repository.\n"
+            "If you still want to run ggshield, make sure you mark "
+            "the current repository as safe for git with:\n"
+            "   git config --global --add safe.directory <YOUR_REPO>"
+        )
+
+
 def git(
     command: List[str],
     timeout: int = COMMAND_TIMEOUT,
@@ -189,14 +227,7 @@ def git(
     ignore_git_config: bool = True,
 ) -> str:
     """Calls git with the given arguments, returns stdout as a string"""
-    env = os.environ.copy()
-    # Ensure git messages are in English
-    env["LANG"] = "C"
-    # Ensure git behavior is not affected by the user git configuration, but give us a
-    # way to set some configuration (useful for safe.directory)
-    if ignore_git_config:
-        env["GIT_CONFIG_GLOBAL"] = os.getenv("GG_GIT_CONFIG", "")
-        env["GIT_CONFIG_SYSTEM"] = ""
+    env = _get_git_env(ignore_git_config)
 
     if cwd is None:
         cwd = Path.cwd()
@@ -219,16 +250,7 @@ def git(
             )
         return result.stdout.decode("utf-8", errors="ignore").rstrip()
     except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.decode("utf-8", errors="ignore")
-        if log_stderr:
-            logger.error("command=%s, stderr=%s", command, stderr)
-        if "detected dubious ownership in repository" in stderr:
-            raise GitError(
-                "Git command failed because of a dubious ownership in repository.\n"
-                "If you still want to run ggshield, make sure you mark "
-                "the current repository as safe for git with:\n"
-                "   git config --global --add safe.directory <YOUR_REPO>"
-            )
+        _check_git_error(command, exc, log_stderr)
         raise exc
     except subprocess.TimeoutExpired:
         raise GitCommandTimeoutExpired(
@@ -236,6 +258,99 @@ def git(
         )
 
 
+def git_stream(
+    command: List[str],
+    timeout: int = COMMAND_TIMEOUT,
+    cwd: Optional[Union[str, Path]] = None,
+    log_stderr: bool = True,
+    ignore_git_config: bool = True,
+) -> Iterator[bytes]:
+    """Calls git with the given arguments, yields stdout as raw chunks while git is
+    running. Like `git()`, trailing whitespace is removed from the output.
+
+    Chunks are not decoded, so that callers can split the output before decoding it.
+    Chunks may end in the middle of a multi-byte character.
+
+    The timeout only covers the time spent waiting on git: the clock is paused while
+    the caller processes a chunk, so slow consumers do not cause a timeout.
+
+    Errors are reported like `git()` does (with check=True), once all the output has
+    been read."""
+    env = _get_git_env(ignore_git_config)
+
+    if cwd is None:
+        cwd = Path.cwd()
+
+    logger.debug("command=%s timeout=%d", command, timeout)
+    timed_out = threading.Event()
+
+    # stderr goes to a file so that git cannot block on it while we read stdout
+    with tempfile.TemporaryFile() as stderr_file, subprocess.Popen(
+        [_get_git_path()] + command,
+        stdout=subprocess.PIPE,
+        stderr=stderr_file,
+        env=env,
+        cwd=str(cwd),
+    ) as proc:
+
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        remaining = float(timeout)
+
+        def wait_for_git(func: Callable[[], T]) -> T:
+            """Calls `func` with the kill timer armed for the remaining time"""
+            nonlocal remaining
+            timer = threading.Timer(remaining, kill)
+            start = time.monotonic()
+            timer.start()
+            try:
+                return func()
+            finally:
+                timer.cancel()
+                remaining -= time.monotonic() - start
+
+        stdout = proc.stdout
+        assert stdout is not None
+        try:
+            # Trailing whitespace is held back until more content comes, so that
+            # the output is right-stripped, like in `git()`
+            pending = b""
+            while chunk := wait_for_git(lambda: stdout.read1(STREAM_CHUNK_SIZE)):
+                chunk = pending + chunk
+                stripped_chunk = chunk.rstrip()
+                pending = chunk[len(stripped_chunk) :]
+                if stripped_chunk:
+                    yield stripped_chunk
+            returncode = wait_for_git(proc.wait)
+        finally:
+            if proc.poll() is None:
+                # We have been interrupted before the end of the output
+                proc.kill()
+
+        if timed_out.is_set():
+            raise GitCommandTimeoutExpired(
+                'Command "{}" timed out'.format(" ".join(command))
+            )
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+
+    if returncode != 0:
+        exc = subprocess.CalledProcessError(
+            returncode, proc.args, output=None, stderr=stderr
+        )
+        _check_git_error(command, exc, log_stderr)
+        raise exc
+    if stderr and log_stderr:
+        logger.debug(
+            "command=%s, stderr=%s",
+            command,
+            stderr.decode("utf-8", errors="ignore"),
+        )
+
+
 def git_ls(wd: Optional[Union[str, Path]] = None) -> List[str]:
     cmd = ["ls-files", "--recurse-submodules"]
     return git(cmd, timeout=600, cwd=wd).split("\n")
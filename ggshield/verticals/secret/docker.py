@@ -5,7 +5,7 @@ import tarfile
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterable, List
+from typing import Any, Dict, Generator, Iterable, List, Optional
 
 from click import UsageError
 from pygitguardian import GGClient
@@ -56,6 +56,8 @@ class DockerContentScannable(Scannable):
     A Scannable for a file inside a Docker image
     """
 
+    __slots__ = ["_layer_id", "_tar_file", "_tar_info", "_path"]
+
     def __init__(
         self, layer_id: str, tar_file: tarfile.TarFile, tar_info: tarfile.TarInfo
     ):
@@ -63,6 +65,7 @@ class DockerContentScannable(Scannable):
         self._layer_id = layer_id
         self._tar_file = tar_file
         self._tar_info = tar_info
+        self._path: Optional[Path] = None
 
     @property
     def url(self) -> str:
@@ -74,7 +77,9 @@ class DockerContentScannable(Scannable):
 
     @property
     def path(self) -> Path:
-        return Path("/", self._tar_info.name)
+        if self._path is None:
+            self._path = Path("/", self._tar_info.name)
+        return self._path
 
     def is_longer_than(self, max_utf8_encoded_size: int) -> bool:
         if self._utf8_encoded_size is not None:
@@ -1,13 +1,11 @@
-DETECTOR_NAMES = [
+DETECTOR_NAMES = (
     "Basic Auth String",
     "Generic Password",
     "JSON Web Token",
     "Generic Terraform Variable Secret",
     "Generic Database Assignment",
     "Company Email Password",
-    "Generic Password",
     "Base64 Generic High Entropy Secret",
-    "Generic Database Assignment",
     "Generic CLI Option Secret",
     "Username Password",
     "Generic High Entropy Secret",
@@ -49,8 +47,8 @@ DETECTOR_NAMES = [
     "FullContact Key",
     "Nylas API Key",
     "Plaid Access Token",
-]
-MATCH_NAMES = [
+)
+MATCH_NAMES = (
     "apikey",
     "client_id",
     "client_secret",
@@ -89,4 +87,4 @@ MATCH_NAMES = [
     "client_certificate",
     "client_key",
     "config_value",
-]
+)
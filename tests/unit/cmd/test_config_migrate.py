@@ -1,4 +1,3 @@
-from copy import deepcopy
 from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict
@@ -56,14 +55,20 @@ def normalize_config_dict(dct: Dict[str, Any]) -> Dict[str, Any]:
     """
     Sort lists inside a config dict so that the dicts can be compared with ==
     """
-    dct = deepcopy(dct)
+    # Only the "secret" dict is modified, and sorted() creates new lists: shallow
+    # copies are enough to leave `dct` untouched
+    dct = dict(dct)
     try:
-        dct["secret"]["ignored_paths"] = sorted(dct["secret"]["ignored_paths"])
+        secret = dct["secret"] = dict(dct["secret"])
+    except KeyError:
+        return dct
+    try:
+        secret["ignored_paths"] = sorted(secret["ignored_paths"])
     except KeyError:
         pass
     try:
-        dct["secret"]["ignored_matches"] = sorted(
-            dct["secret"]["ignored_matches"], key=itemgetter("match")
+        secret["ignored_matches"] = sorted(
+            secret["ignored_matches"], key=itemgetter("match")
         )
     except KeyError:
         pass
@@ -15,6 +15,7 @@ from pygitguardian.models import ScanResult, SecretIncident
 from requests.utils import DEFAULT_CA_BUNDLE_PATH, extract_zipped_paths
 
 from ggshield.core.cache import Cache
+from ggshield.core.config.utils import _reset_yaml_cache, _SafeDumper
 from ggshield.core.ui.reset import reset
 from ggshield.core.url_utils import dashboard_to_api_url
 from ggshield.utils.git_shell import (
@@ -695,8 +696,15 @@ def write_text(filename: Union[str, Path], content: str):
 
 
 def write_yaml(filename: Union[str, Path], data: Any):
-    """Save data as a YAML file in `filename`, using `write_text()`"""
-    write_text(filename, yaml.dump(data))
+    """Save data as a YAML file in `filename`.
+    Create any missing dirs if necessary.
+
+    The data is dumped to UTF-8 bytes directly, so like `write_text()` the file
+    content does not depend on the OS.
+    """
+    path = Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(yaml.dump(data, Dumper=_SafeDumper, encoding="utf-8"))
 
 
 def assert_invoke_exited_with(result: Result, exit_code: int):
@@ -731,6 +739,9 @@ def clear_cache():
     _get_git_path.cache_clear()
     _git_rev_parse_absolute.cache_clear()
     read_git_file.cache_clear()
+    # Files from different fake file systems can share the same path, modification
+    # time and size
+    _reset_yaml_cache()
 
 
 @pytest.fixture(autouse=True)
@@ -8,28 +8,28 @@ import pytest
 from ggshield.core.config import Config
 from ggshield.core.config.auth_config import (
     InstanceConfig,
+    prepare_auth_config_dict_for_parse,
     prepare_auth_config_dict_for_save,
 )
-from ggshield.core.config.utils import get_auth_config_filepath
 from ggshield.core.errors import UnknownInstanceError
 from tests.unit.conftest import write_text, write_yaml
-from tests.unit.core.config.conftest import TEST_AUTH_CONFIG
+from tests.unit.core.config.conftest import TEST_AUTH_CONFIG, make_test_auth_config
 
 
 @pytest.fixture(autouse=True)
-def env_vars(monkeypatch):
+def env_vars(no_gitguardian_env_vars, monkeypatch):
     monkeypatch.setenv("GITGUARDIAN_API_URL", "https://api.gitguardian.com")
 
 
 @pytest.mark.usefixtures("isolated_fs")
 class TestAuthConfig:
-    def test_load(self):
+    def test_load(self, auth_config_path):
         """
         GIVEN a default auth config
         WHEN loading the config
         THEN when serializing it again, it matches the data.
         """
-        write_yaml(get_auth_config_filepath(), TEST_AUTH_CONFIG)
+        write_yaml(auth_config_path, TEST_AUTH_CONFIG)
 
         config = Config()
 
@@ -41,51 +41,68 @@ class TestAuthConfig:
         config_data = prepare_auth_config_dict_for_save(config_data)
         assert config_data == TEST_AUTH_CONFIG
 
+    def test_prepare_dict_does_not_modify_input(self):
+        """
+        GIVEN an auth config dict
+        WHEN preparing it for parsing, then preparing the result for saving
+        THEN the final dict matches the original one
+        AND the input dicts have not been modified
+        """
+        raw_config = make_test_auth_config()
+
+        parse_dict = prepare_auth_config_dict_for_parse(raw_config)
+        assert raw_config == TEST_AUTH_CONFIG
+
+        expected_parse_dict = deepcopy(parse_dict)
+        save_dict = prepare_auth_config_dict_for_save(parse_dict)
+        assert parse_dict == expected_parse_dict
+        assert save_dict == TEST_AUTH_CONFIG
+
     @pytest.mark.parametrize("n", [0, 2])
-    def test_no_account(self, n):
+    def test_no_account(self, auth_config_path, n):
         """
         GIVEN an auth config with a instance with 0 or more than 1 accounts
         WHEN loading the AuthConfig
         THEN it raises
         """
-        raw_config = deepcopy(TEST_AUTH_CONFIG)
+        raw_config = make_test_auth_config()
         raw_config["instances"][0]["accounts"] = (
             raw_config["instances"][0]["accounts"] * n
         )
-        write_yaml(get_auth_config_filepath(), raw_config)
+        write_yaml(auth_config_path, raw_config)
 
         with pytest.raises(
             AssertionError,
             match="Each GitGuardian instance should have exactly one account",
         ):
-            Config()
+            Config().auth_config
 
-    def test_invalid_format(self):
+    def test_invalid_format(self, auth_config_path):
         """
         GIVEN an auth config file with invalid content
         WHEN loading AuthConfig
         THEN it raises
         """
-        write_text(get_auth_config_filepath(), "Not a:\nyaml file.\n")
+        write_text(auth_config_path, "Not a:\nyaml file.\n")
         expected_output = (
-            f"{re.escape(str(get_auth_config_filepath()))} is not a valid YAML file:"
+            f"{re.escape(str(auth_config_path))} is not a valid YAML file:"
         )
 
         with pytest.raises(
             ValueError,
             match=expected_output,
         ):
-            Config()
+            Config().auth_config
 
-    def test_token_not_expiring(self):
+    def test_token_not_expiring(self, auth_config_path):
         """
         GIVEN an auth config file with a token never expiring
         WHEN loading the AuthConfig
         THEN it works
         """
-        raw_config = deepcopy(TEST_AUTH_CONFIG)
+        raw_config = make_test_auth_config()
         raw_config["instances"][0]["accounts"][0]["expire_at"] = None
-        write_yaml(get_auth_config_filepath(), raw_config)
+        write_yaml(auth_config_path, raw_config)
 
         config = Config()
 
@@ -119,7 +136,7 @@ class TestAuthConfig:
         assert config.instance_name == "https://dashboard.gitguardian.com"
         assert config.auth_config.instances == []
 
-    def test_save_file_not_existing(self):
+    def test_save_file_not_existing(self, auth_config_path):
         """
         GIVEN a config object and the auth config file not existing
         WHEN saving the config
@@ -127,7 +144,7 @@ class TestAuthConfig:
         AND when loading the config again it has the correct values
         """
         config = Config()
-        assert not os.path.exists(get_auth_config_filepath())
+        assert not os.path.exists(auth_config_path)
 
         config.auth_config.get_or_create_instance("custom")
         config.save()
@@ -136,13 +153,13 @@ class TestAuthConfig:
         instance = updated_config.auth_config.get_instance("custom")
         assert instance.url == "custom"
 
-    def test_timezone_aware_expired(self):
+    def test_timezone_aware_expired(self, auth_config_path):
         """
         GIVEN a config with a configured instance
         WHEN loading the config
         THEN the instance expiration date is timezone aware
         """
-        write_yaml(get_auth_config_filepath(), TEST_AUTH_CONFIG)
+        write_yaml(auth_config_path, TEST_AUTH_CONFIG)
         config = Config()
         assert config.auth_config.instances[0].account.expire_at.tzinfo is not None
 
@@ -1,20 +1,23 @@
-import os
 import sys
-from copy import deepcopy
 from enum import IntEnum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import pytest
+import yaml
 from click import UsageError
 
 from ggshield.core.config import AccountConfig, Config, InstanceConfig
-from ggshield.core.config.utils import get_auth_config_filepath, load_yaml_dict
+from ggshield.core.config.utils import (
+    _SafeDumper,
+    get_auth_config_filepath,
+    load_yaml_dict,
+)
 from ggshield.core.constants import DEFAULT_LOCAL_CONFIG_PATH
 from ggshield.core.errors import UnknownInstanceError
 from ggshield.core.url_utils import dashboard_to_api_url
-from tests.unit.conftest import write_yaml
-from tests.unit.core.config.conftest import TEST_AUTH_CONFIG
+from tests.unit.conftest import write_text, write_yaml
+from tests.unit.core.config.conftest import make_test_auth_config
 
 
 class InstanceNamePriority(IntEnum):
@@ -27,38 +30,44 @@ class InstanceNamePriority(IntEnum):
 INSTANCES = [f"https://{x.lower()}.com" for x in InstanceNamePriority.__members__]
 
 
-@pytest.fixture(autouse=True)
-def env_vars(monkeypatch):
-    monkeypatch.delenv("GITGUARDIAN_INSTANCE", raising=False)
-    monkeypatch.delenv("GITGUARDIAN_API_URL", raising=False)
-    monkeypatch.delenv("GITGUARDIAN_API_KEY", raising=False)
+def _make_instances_auth_config() -> Dict[str, Any]:
+    """Returns the test auth config, with an additional instance for each URL of
+    INSTANCES"""
+    auth_config_data = make_test_auth_config()
+    for url in INSTANCES:
+        config_dict = make_test_auth_config()["instances"][0]
+        config_dict["url"] = url
+        auth_config_data["instances"].append(config_dict)
+    return auth_config_data
 
 
-@pytest.mark.usefixtures("isolated_fs")
+# The auth config is the same for all TestConfig.set_instances() calls, so serialize
+# it only once, with the same dumper as write_yaml()
+INSTANCES_AUTH_CONFIG_YAML = yaml.dump(
+    _make_instances_auth_config(), Dumper=_SafeDumper
+)
+
+
+@pytest.mark.usefixtures("isolated_fs", "no_gitguardian_env_vars")
 class TestConfig:
     def set_instances(
         self, local_filepath: str, global_filepath: str, priority: InstanceNamePriority
     ):
-        auth_config_data = deepcopy(TEST_AUTH_CONFIG)
-        for url in INSTANCES:
-            config_dict = deepcopy(auth_config_data["instances"][0])
-            config_dict["url"] = url
-            auth_config_data["instances"].append(config_dict)
+        # The user configs only contain an `instance` key, write them directly instead
+        # of going through the YAML dumper
         if priority >= InstanceNamePriority.LOCAL:
-            write_yaml(
-                local_filepath, {"instance": INSTANCES[InstanceNamePriority.LOCAL]}
+            write_text(
+                local_filepath, f"instance: {INSTANCES[InstanceNamePriority.LOCAL]}\n"
             )
         else:
-            if os.path.isfile(local_filepath):
-                os.remove(local_filepath)
+            Path(local_filepath).unlink(missing_ok=True)
         if priority >= InstanceNamePriority.GLOBAL:
-            write_yaml(
-                global_filepath, {"instance": INSTANCES[InstanceNamePriority.GLOBAL]}
+            write_text(
+                global_filepath, f"instance: {INSTANCES[InstanceNamePriority.GLOBAL]}\n"
             )
         else:
-            if os.path.isfile(global_filepath):
-                os.remove(global_filepath)
-        write_yaml(get_auth_config_filepath(), auth_config_data)
+            Path(global_filepath).unlink(missing_ok=True)
+        write_text(get_auth_config_filepath(), INSTANCES_AUTH_CONFIG_YAML)
 
     @pytest.mark.parametrize(
         "priority",
@@ -230,9 +239,7 @@ class TestConfig:
         WHEN loading the config
         THEN writes a warning to stderr
         """
-        monkeypatch.setitem(
-            os.environ, "GITGUARDIAN_API_URL", "https://api.gitguardian.com/v1"
-        )
+        monkeypatch.setenv("GITGUARDIAN_API_URL", "https://api.gitguardian.com/v1")
         config = Config()
         api_url = config.api_url
         out, err = capsys.readouterr()
@@ -314,6 +321,21 @@ class TestConfig:
         dct = load_yaml_dict(local_config_path)
         assert dct["instance"] == "https://after.com"
 
+    def test_auth_config_is_loaded_lazily(self, auth_config_path):
+        """
+        GIVEN a config whose auth config has not been accessed
+        WHEN saving the config
+        THEN the auth config file is not written
+        AND accessing the auth config loads it from disk
+        """
+        config = Config()
+        config.save()
+        assert not Path(auth_config_path).exists()
+
+        write_yaml(auth_config_path, make_test_auth_config())
+        assert config.auth_config.default_token_lifetime == 2
+        assert config.auth_config is config.auth_config
+
     @pytest.mark.parametrize(
         "instance_url",
         ["", "http://api.gitguardian.com/", "https://api.gitguardian.com/abc"],
@@ -325,7 +347,7 @@ class TestConfig:
         THEN it raises a UsageError
         """
 
-        monkeypatch.setitem(os.environ, "GITGUARDIAN_API_URL", instance_url)
+        monkeypatch.setenv("GITGUARDIAN_API_URL", instance_url)
         with pytest.raises(UsageError):
             config = Config()
             config.instance_name
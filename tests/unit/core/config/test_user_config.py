@@ -13,6 +13,7 @@ from ggshield.core.config.user_config import (
     IaCConfigIgnoredPolicy,
     SCAConfig,
     SCAConfigIgnoredVulnerability,
+    SecretConfig,
     UserConfig,
 )
 from ggshield.core.errors import ParseError, UnexpectedError
@@ -20,7 +21,7 @@ from ggshield.core.types import IgnoredMatch
 from tests.unit.conftest import write_text, write_yaml
 
 
-@pytest.mark.usefixtures("isolated_fs")
+@pytest.mark.usefixtures("isolated_fs", "no_gitguardian_env_vars")
 class TestUserConfig:
     def _assert_times(self, time1: Optional[datetime], time2: Optional[str]):
         if time1 is not None:
@@ -179,6 +180,37 @@ class TestUserConfig:
             IgnoredMatch(name="", match="dbca"),
         ]
 
+    def test_add_ignored_matches(self):
+        """
+        GIVEN a secret config with ignored matches, one of them without a name
+        WHEN adding new and already ignored matches
+        THEN only new matches are added
+        AND the unnamed ignored match gets a name
+        """
+        config = SecretConfig(
+            ignored_matches=[
+                IgnoredMatch(name="", match="abcd"),
+                IgnoredMatch(name="named", match="dbca"),
+            ]
+        )
+
+        config.add_ignored_matches(
+            [
+                IgnoredMatch(name="new", match="1234"),
+                IgnoredMatch(name="abcd-name", match="abcd"),
+                IgnoredMatch(name="other-name", match="dbca"),
+                IgnoredMatch(name="new-again", match="1234"),
+            ]
+        )
+        config.add_ignored_match(IgnoredMatch(name="single", match="5678"))
+
+        assert config.ignored_matches == [
+            IgnoredMatch(name="abcd-name", match="abcd"),
+            IgnoredMatch(name="named", match="dbca"),
+            IgnoredMatch(name="new", match="1234"),
+            IgnoredMatch(name="single", match="5678"),
+        ]
+
     @pytest.mark.parametrize(
         "paths",
         (
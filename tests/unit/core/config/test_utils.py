@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Any, Dict
 
@@ -5,9 +6,11 @@ import pytest
 
 from ggshield.core.config.utils import (
     find_local_config_path,
+    load_yaml_dict,
     remove_common_dict_items,
     remove_url_trailing_slash,
     replace_dash_in_keys,
+    save_yaml_dict,
     update_dict_from_other,
 )
 from ggshield.utils.os import cd
@@ -40,6 +43,96 @@ def test_replace_dash_in_keys():
     assert dash_keys == {"use-dash", "sub-dash-key", "dash-or-underscore"}
 
 
+def test_replace_dash_in_keys_nested_lists():
+    """
+    GIVEN a dict containing lists of dicts using dash keys
+    WHEN replace_dash_in_keys() is called
+    THEN the keys of the dicts inside the lists are replaced too
+    """
+    data = {
+        "instances": [
+            {"default-token-lifetime": 1, "accounts": [{"token-name": "a"}]},
+            ["not-a-key", {"nested-list-key": 2}],
+        ]
+    }
+
+    dash_keys = replace_dash_in_keys(data)
+
+    assert data == {
+        "instances": [
+            {"default_token_lifetime": 1, "accounts": [{"token_name": "a"}]},
+            ["not-a-key", {"nested_list_key": 2}],
+        ]
+    }
+    assert dash_keys == {"default-token-lifetime", "token-name", "nested-list-key"}
+
+
+def test_load_yaml_dict_returns_copies(tmp_path: Path):
+    """
+    GIVEN a YAML file which has already been loaded
+    WHEN load_yaml_dict() is called again
+    THEN it returns a dict equal to the first one
+    AND modifications done on the first dict do not affect the second one
+    """
+    path = tmp_path / "config.yaml"
+    path.write_text("outer:\n  inner: 1\n")
+
+    first = load_yaml_dict(path)
+    assert first is not None
+    first["outer"]["inner"] = 2
+
+    assert load_yaml_dict(path) == {"outer": {"inner": 1}}
+
+
+def test_load_yaml_dict_reloads_modified_file(tmp_path: Path):
+    """
+    GIVEN a YAML file which has already been loaded
+    WHEN the file is modified
+    THEN load_yaml_dict() returns the new content
+    """
+    path = tmp_path / "config.yaml"
+    path.write_text("key: 1\n")
+    assert load_yaml_dict(path) == {"key": 1}
+
+    save_yaml_dict({"key": 2}, path)
+    assert load_yaml_dict(path) == {"key": 2}
+
+    path.write_text("key: 345\n")
+    assert load_yaml_dict(path) == {"key": 345}
+
+
+def test_load_save_yaml_dict_non_ascii(tmp_path: Path):
+    """
+    GIVEN a YAML file containing non-ASCII characters
+    WHEN loading it, then saving it again
+    THEN the characters are preserved
+    """
+    path = tmp_path / "config.yaml"
+    path.write_bytes("name: héllo\n".encode())
+    assert load_yaml_dict(path) == {"name": "héllo"}
+
+    save_yaml_dict({"name": "wörld"}, path)
+    assert load_yaml_dict(path) == {"name": "wörld"}
+
+
+def test_save_yaml_dict_skips_unchanged_file(tmp_path: Path):
+    """
+    GIVEN a YAML file
+    WHEN saving the same content in it
+    THEN the file is not rewritten
+    """
+    path = tmp_path / "config.yaml"
+    save_yaml_dict({"key": 1}, path)
+    os.utime(path, ns=(0, 0))
+
+    save_yaml_dict({"key": 1}, path)
+    assert path.stat().st_mtime_ns == 0
+
+    save_yaml_dict({"key": 2}, path)
+    assert path.stat().st_mtime_ns != 0
+    assert load_yaml_dict(path) == {"key": 2}
+
+
 def test_update_dict_from_other():
     """
     GIVEN two dictionaries
@@ -143,3 +236,21 @@ def test_find_config_in_root(tmp_path: Path):
 
     with cd(str(dir_path)):
         assert find_local_config_path() == config_path
+
+
+def test_find_config_priority(tmp_path: Path):
+    """
+    GIVEN a repo with several config files in the root
+    WHEN trying to find the local config
+    THEN the config with the highest priority is returned
+    """
+    Repository.create(tmp_path)
+
+    (tmp_path / ".gitguardian.yaml").touch()
+    (tmp_path / ".gitguardian.yml").touch()
+
+    with cd(str(tmp_path)):
+        assert find_local_config_path() == tmp_path / ".gitguardian.yml"
+
+        (tmp_path / ".gitguardian").touch()
+        assert find_local_config_path() == tmp_path / ".gitguardian"
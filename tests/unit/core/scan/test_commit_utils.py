@@ -3,7 +3,13 @@ from typing import Optional, Tuple
 
 import pytest
 
-from ggshield.core.scan.commit_utils import PatchFileInfo, convert_multi_parent_diff
+from ggshield.core.scan.commit_utils import (
+    PatchFileInfo,
+    PatchHeader,
+    convert_multi_parent_diff,
+    parse_patch,
+    parse_patch_chunks,
+)
 from ggshield.utils.git_shell import Filemode
 
 
@@ -29,6 +35,14 @@ from ggshield.utils.git_shell import Filemode
             ":::100644 100644 100644 100644 c57e98a c9d3d3d 6eb4116 127e89b MMM\0file7\0",
             (None, "file7", Filemode.MODIFY),
         ),
+        (
+            "::100644 100644 000000 c57e98a c9d3d3d 0000000 DM\0file8\0",
+            (None, "file8", Filemode.MODIFY),
+        ),
+        (
+            "::100644 100644 000000 c57e98a c9d3d3d 0000000 DA\0file9\0",
+            (None, "file9", Filemode.NEW),
+        ),
     ],
 )
 def test_patch_file_info_from_string(
@@ -48,6 +62,40 @@ def test_patch_file_info_from_string(
     assert PatchFileInfo.from_string(line) == expected_info
 
 
+def test_patch_file_info_from_string_unknown_status():
+    """
+    GIVEN a header line from a git show raw patch with an unknown status
+    WHEN PatchFileInfo.from_string() is called
+    THEN it raises a ValueError
+    """
+    with pytest.raises(ValueError, match="unknown status X"):
+        PatchFileInfo.from_string(":100644 100644 bcd1234 0123456 X\0file0\0")
+
+
+def test_patch_header_from_string():
+    """
+    GIVEN a raw patch header with commit info and several file lines
+    WHEN PatchHeader.from_string() is called
+    THEN the commit info and the files are correctly parsed
+    """
+    header = (
+        "commit 1234\nAuthor: A <a@b.c>\nDate: now\n\n    Some: message\n\n"
+        ":100644 100644 bcd1234 0123456 M\0file0\0"
+        ":100644 100644 abcd123 1234567 R86\0file1\0file2\0"
+        ":000000 100644 0000000 1234567 A\0file3\0"
+    )
+    result = PatchHeader.from_string(header)
+
+    assert result.info == (
+        "commit 1234\nAuthor: A <a@b.c>\nDate: now\n\n    Some: message\n"
+    )
+    assert result.files == [
+        PatchFileInfo(None, Path("file0"), Filemode.MODIFY),
+        PatchFileInfo(Path("file1"), Path("file2"), Filemode.RENAME),
+        PatchFileInfo(None, Path("file3"), Filemode.NEW),
+    ]
+
+
 @pytest.mark.parametrize(
     ("diff", "expected"),
     [
@@ -109,3 +157,58 @@ def test_convert_multi_parent_diff(diff: str, expected: str):
     expected = expected.strip()
     result = convert_multi_parent_diff(diff)
     assert result == expected
+
+
+PATCH = (
+    "commit 1234\nAuthor: Owl <owl@example.com>\nDate: Thu Aug 18 18:20:21 2022\n\n"
+    ":000000 100644 0000000 e965047 A\0a.txt\0"
+    ":100644 100644 1234567 e965047 M\0b.txt\0"
+    "\0diff --git a/a.txt b/a.txt\n"
+    "new file mode 100644\n"
+    "index 0000000..e965047\n"
+    "--- /dev/null\n"
+    "+++ b/a.txt\n"
+    "@@ -0,0 +1,2 @@\n"
+    "+Héllo\n"
+    "+diff this\n"
+    "diff --git a/b.txt b/b.txt\n"
+    "index 1234567..e965047\n"
+    "--- a/b.txt\n"
+    "+++ b/b.txt\n"
+    "@@ -1 +1 @@\n"
+    "-old\n"
+    "+new\n"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 6, 7, 100, 100_000])
+def test_parse_patch_chunks(chunk_size: int):
+    """
+    GIVEN a patch split in chunks, possibly in the middle of multi-byte characters
+    WHEN parse_patch_chunks() is called
+    THEN it returns the same scannables as parse_patch() on the whole patch
+    """
+    raw_patch = PATCH.encode()
+    chunks = [
+        raw_patch[i : i + chunk_size] for i in range(0, len(raw_patch), chunk_size)
+    ]
+
+    expected = [(x.url, x.content, x.filemode) for x in parse_patch("sha", PATCH, None)]
+    result = [
+        (x.url, x.content, x.filemode) for x in parse_patch_chunks("sha", chunks, None)
+    ]
+
+    assert result == expected
+    assert [x[1] for x in result] == [
+        "@@ -0,0 +1,2 @@\n+Héllo\n+diff this\n",
+        "@@ -1 +1 @@\n-old\n+new\n",
+    ]
+
+
+def test_parse_patch_no_diff():
+    """
+    GIVEN a patch without any diff
+    WHEN parse_patch() is called
+    THEN it returns no scannable
+    """
+    assert list(parse_patch("sha", "commit 1234\nAuthor: <>\n", None)) == []
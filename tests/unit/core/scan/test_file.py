@@ -1,11 +1,12 @@
 import codecs
+from collections import OrderedDict
 from pathlib import Path
 from random import randrange
 
 import charset_normalizer
 import pytest
 
-from ggshield.core.scan import DecodeError, File
+from ggshield.core.scan import DecodeError, File, scannable
 from ggshield.core.scan.file import create_files_from_paths
 from tests.conftest import is_windows
 
@@ -93,12 +94,12 @@ def test_file_is_longer_than_does_not_read_large_files(tmp_path):
     assert file._content is None
 
 
-def test_file_is_longer_than_does_not_read_utf8_file(tmp_path):
+def test_file_is_longer_than_keeps_utf8_file_content(tmp_path):
     """
-    GIVEN a File instance on either a small utf8 file
+    GIVEN a File instance on a small utf8 file
     WHEN is_longer_than() is called on it
     THEN it returns False
-    AND the content is not read
+    AND the decoded content is kept
     """
     path = tmp_path / "test.conf"
     path.write_text(UNICODE_TEST_CONTENT, encoding="utf-8")
@@ -106,7 +107,7 @@ def test_file_is_longer_than_does_not_read_utf8_file(tmp_path):
 
     file = File(path)
     assert not file.is_longer_than(1000)
-    assert file._content is None
+    assert file._content == UNICODE_TEST_CONTENT
 
 
 def test_file_is_longer_than_if_file_has_been_read(tmp_path):
@@ -182,6 +183,43 @@ def test_file_is_longer_using_8bit_codec(tmp_path):
     assert file.is_longer_than(len(byte_content))
 
 
+@pytest.mark.parametrize(
+    ("content", "expected_detections"),
+    [
+        ("print('Hello world')\n", 0),
+        (UNICODE_TEST_CONTENT, 1),
+    ],
+)
+def test_file_detects_encoding_once(
+    tmp_path, monkeypatch, content: str, expected_detections: int
+):
+    """
+    GIVEN a File instance on a small ASCII or UTF-8 file
+    WHEN is_longer_than() is called, then its content is read, several times
+    THEN the encoding detector is not called for ASCII content
+    AND it is called at most once for other content
+    """
+    monkeypatch.setattr(scannable, "_encoding_cache", OrderedDict())
+    detections = []
+
+    def from_bytes(*args, **kwargs):
+        detections.append(args)
+        return real_from_bytes(*args, **kwargs)
+
+    real_from_bytes = charset_normalizer.from_bytes
+    monkeypatch.setattr(charset_normalizer, "from_bytes", from_bytes)
+
+    path = tmp_path / "test.py"
+    path.write_text(content, encoding="utf-8")
+
+    for _ in range(3):
+        file = File(path)
+        assert not file.is_longer_than(1000)
+        assert file.content == content
+
+    assert len(detections) == expected_detections
+
+
 def test_file_repr():
     """
     GIVEN a File instance
@@ -1,8 +1,9 @@
+import urllib.parse
 from pathlib import Path
 
 import pytest
 
-from ggshield.core.scan import StringScannable
+from ggshield.core.scan import Scannable, StringScannable
 
 
 def test_string_scannable_path():
@@ -15,6 +16,28 @@ def test_string_scannable_path():
     assert scannable.path == Path("/some/path")
 
 
+@pytest.mark.parametrize(
+    "url",
+    [
+        "some/path",
+        "Dockerfile or build-args",
+        "https://example.com/some/path?query#fragment",
+        "//netloc/some/path",
+        "some/path;params",
+        " some/path",
+        "some\tpath",
+    ],
+)
+def test_string_scannable_path_matches_urlparse(url: str):
+    """
+    GIVEN a StringScannable instance
+    WHEN path() is called
+    THEN it returns the path part of the URL, as returned by urlparse()
+    """
+    scannable = StringScannable(url=url, content="")
+    assert scannable.path == Path(urllib.parse.urlparse(url).path)
+
+
 @pytest.mark.parametrize(
     ("content", "is_longer"),
     (
@@ -32,3 +55,24 @@ def test_string_scannable_is_longer_than(content, is_longer):
     """
     scannable = StringScannable(content=content, url="u")
     assert scannable.is_longer_than(50) == is_longer
+
+
+@pytest.mark.parametrize(
+    ("raw_document", "expected_content"),
+    (
+        (b"Hello world\n", "Hello world\n"),
+        ("Héllo wörld\n".encode("utf-16"), "Héllo wörld\n"),
+        ("Hello world\n".encode("utf-16-le"), "Hello world\n"),
+        ("Héllo wörld\n".encode(), "Héllo wörld\n"),
+    ),
+)
+def test_decode_bytes(raw_document: bytes, expected_content: str):
+    """
+    GIVEN a document in a given encoding
+    WHEN _decode_bytes() is called on it, twice
+    THEN it returns the decoded content and its utf-8 encoded size both times
+    """
+    for _ in range(2):
+        content, utf8_encoded_size = Scannable._decode_bytes(raw_document)
+        assert content == expected_content
+        assert utf8_encoded_size == len(expected_content.encode())
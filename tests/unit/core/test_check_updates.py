@@ -4,14 +4,17 @@ from unittest.mock import Mock, patch
 import pytest
 import requests.exceptions
 from _pytest.monkeypatch import MonkeyPatch
-from pyfakefs.fake_filesystem import FakeFilesystem
 
 import ggshield.core
-from ggshield.core.check_updates import (
-    CACHE_FILE,
-    check_for_updates,
-    load_last_check_time,
-)
+from ggshield.core.check_updates import check_for_updates, load_last_check_time
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    """Points the update check cache to a file in a temporary directory"""
+    path = tmp_path / "cache" / "update_check.json"
+    monkeypatch.setattr(ggshield.core.check_updates, "CACHE_FILE", path)
+    return path
 
 
 @patch("requests.get")
@@ -32,7 +35,7 @@ def test_check_for_updates(
     current_version: str,
     remote_version: str,
     expected_latest_version: bool,
-    fs: FakeFilesystem,
+    cache_file: Path,
     monkeypatch: MonkeyPatch,
 ):
     """
@@ -47,12 +50,35 @@ def test_check_for_updates(
     latest_version = check_for_updates()
 
     assert latest_version == expected_latest_version
-    assert fs.exists(CACHE_FILE)
+    assert cache_file.exists()
+
+
+@patch("requests.get")
+@pytest.mark.parametrize("tag_name", ["1.2.4", "v1.2.4-rc1", "nightly"])
+def test_check_for_updates_unexpected_tag_name(
+    request_get_mock: Mock,
+    tag_name: str,
+    caplog,
+    cache_file: Path,
+    monkeypatch: MonkeyPatch,
+):
+    """
+    GIVEN a latest release whose tag name is not a "vX.Y.Z" version
+    WHEN calling check_for_updates
+    THEN no update is reported
+    AND a warning is logged
+    """
+    monkeypatch.setattr(ggshield.core.check_updates, "__version__", "1.2.3")
+    request_get_mock.return_value.status_code = 200
+    request_get_mock.return_value.json.return_value = {"tag_name": tag_name}
+
+    assert check_for_updates() is None
+    assert "Failed to parse response" in caplog.text
 
 
 @patch("requests.get")
 def test_check_for_updates_twice_only_notifies_once(
-    request_get_mock: Mock, fs: FakeFilesystem, monkeypatch: MonkeyPatch
+    request_get_mock: Mock, cache_file: Path, monkeypatch: MonkeyPatch
 ):
     """
     GIVEN a first check_for_updates() call
@@ -75,7 +101,7 @@ def test_check_for_updates_twice_only_notifies_once(
 
 @patch("requests.get")
 def test_check_for_updates_request_exceptions_are_caught(
-    request_get_mock: Mock, fs: FakeFilesystem
+    request_get_mock: Mock, cache_file: Path
 ):
     """
     GIVEN an environment with no network access to api.github.com
@@ -87,12 +113,12 @@ def test_check_for_updates_request_exceptions_are_caught(
     latest_version = check_for_updates()
     assert latest_version is None
 
-    assert fs.exists(CACHE_FILE)
+    assert cache_file.exists()
 
 
 @patch("requests.get")
 def test_check_for_updates_does_nothing_if_cache_cant_be_saved(
-    request_get_mock: Mock, fs: FakeFilesystem
+    request_get_mock: Mock, cache_file: Path
 ):
     """
     GIVEN an environment where it is not possible to save the check time
@@ -102,26 +128,26 @@ def test_check_for_updates_does_nothing_if_cache_cant_be_saved(
     """
     # Create the cache file as a directory to simulate the case where the cache file is
     # not writable
-    Path(CACHE_FILE).mkdir(parents=True, exist_ok=False)
+    cache_file.mkdir(parents=True, exist_ok=False)
 
     latest_version = check_for_updates()
     assert latest_version is None
     request_get_mock.assert_not_called()
 
 
-def test_load_last_check_time_ok(fs: FakeFilesystem):
+def test_load_last_check_time_ok(cache_file: Path):
     """
     GIVEN an update cache file
     WHEN load_last_check_time() is called
     THEN it correctly reads the last check time
     """
-    Path(CACHE_FILE).parent.mkdir(parents=True, exist_ok=False)
-    Path(CACHE_FILE).write_text("check-at: 2")
+    cache_file.parent.mkdir(parents=True, exist_ok=False)
+    cache_file.write_text('{"check-at": 2}')
 
     assert load_last_check_time() == 2
 
 
-def test_load_last_check_time_no_cache_ok(caplog, fs: FakeFilesystem):
+def test_load_last_check_time_no_cache_ok(caplog, cache_file: Path):
     """
     GIVEN no update cache file
     WHEN load_last_check_time() is called
@@ -135,12 +161,13 @@ def test_load_last_check_time_no_cache_ok(caplog, fs: FakeFilesystem):
 @pytest.mark.parametrize(
     "content",
     [
-        "this-is-not-yaml",
-        "no-cache-key: 1",
-        "check-at: not_a_float",
+        "this-is-not-json",
+        '{"no-cache-key": 1}',
+        '{"check-at": "not_a_float"}',
+        "[]",
     ],
 )
-def test_load_last_check_time_swallows_errors(caplog, fs: FakeFilesystem, content: str):
+def test_load_last_check_time_swallows_errors(caplog, cache_file: Path, content: str):
     """
     GIVEN invalid content for the cache file
     WHEN load_last_check_time() is called
@@ -148,8 +175,8 @@ def test_load_last_check_time_swallows_errors(caplog, fs: FakeFilesystem, conten
     AND it returns None
     AND 1 warning message is logged
     """
-    Path(CACHE_FILE).parent.mkdir(parents=True, exist_ok=False)
-    Path(CACHE_FILE).write_text(content)
+    cache_file.parent.mkdir(parents=True, exist_ok=False)
+    cache_file.write_text(content)
 
     assert load_last_check_time() is None
     log_record = caplog.records[0]
@@ -10,6 +10,7 @@ import pytest
 from ggshield.core.tar_utils import get_empty_tar
 from ggshield.utils.files import (
     ListFilesMode,
+    combine_regexes,
     is_path_excluded,
     list_files,
     url_for_path,
@@ -47,6 +48,38 @@ def test_is_path_excluded(
     assert is_path_excluded(path, regexes) == excluded
 
 
+@pytest.mark.parametrize(
+    "path,excluded",
+    [
+        ("foo", True),
+        ("dir/BAR", True),
+        ("dir/bar", True),
+        ("dir/bar.txt", False),
+        ("baz/qux", True),
+        ("qux", False),
+    ],
+)
+def test_combine_regexes(path: str, excluded: bool) -> None:
+    """
+    GIVEN regexes, some of them using flags
+    WHEN combine_regexes() is called on them
+    THEN it returns one regex per set of flags
+    AND searching a path with the combined regexes gives the same result as searching
+    with the original ones
+    """
+    regexes = {
+        re.compile("^foo$"),
+        re.compile("(^|/)BAR$", re.IGNORECASE),
+        re.compile("^baz/"),
+    }
+
+    combined = combine_regexes(regexes)
+
+    assert len(combined) == 2
+    assert is_path_excluded(path, combined) == excluded
+    assert is_path_excluded(path, regexes) == excluded
+
+
 def test_list_files_git_repo(tmp_path: Path):
     """
     GIVEN a git repo
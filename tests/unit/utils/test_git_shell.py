@@ -1,5 +1,7 @@
 import os
+import subprocess
 import tarfile
+import time
 from io import BytesIO
 from pathlib import Path
 from typing import Optional
@@ -7,6 +9,7 @@ from typing import Optional
 import pytest
 
 from ggshield.core.tar_utils import tar_from_ref_and_filepaths
+from ggshield.utils import git_shell
 from ggshield.utils.git_shell import (
     InvalidGitRefError,
     NotAGitDirectory,
@@ -21,6 +24,7 @@ from ggshield.utils.git_shell import (
     get_staged_filepaths,
     git,
     git_ls_unstaged,
+    git_stream,
     is_git_dir,
     is_valid_git_commit_ref,
     simplify_git_url,
@@ -50,6 +54,60 @@ def test_git_shell():
     assert "usage: git" in git(["help"])
 
 
+def _create_repository_with_commit(repository_path: Path) -> Repository:
+    repository = Repository.create(repository_path)
+    content = "".join(f"Line {i}\n" for i in range(20))
+    (repository.path / "file.txt").write_text(content)
+    repository.add("file.txt")
+    repository.create_commit()
+    return repository
+
+
+def test_git_stream_returns_same_output_as_git(tmp_path):
+    """
+    GIVEN a git command
+    WHEN it is called with git_stream()
+    THEN joining and decoding the returned chunks gives the output of git()
+    """
+    repository = _create_repository_with_commit(tmp_path)
+    command = ["show", "--raw", "-z", "--patch", "HEAD"]
+    output = git_stream(command, cwd=repository.path)
+    assert b"".join(output).decode() == git(command, cwd=repository.path)
+
+
+def test_git_stream_raises_on_failure(tmp_path):
+    """
+    GIVEN a failing git command
+    WHEN its output is read with git_stream()
+    THEN CalledProcessError is raised
+    """
+    repository = _create_repository_with_commit(tmp_path)
+    with pytest.raises(subprocess.CalledProcessError):
+        list(git_stream(["show", "invalid_ref"], cwd=repository.path, log_stderr=False))
+
+
+def test_git_stream_timeout_ignores_consumer_time(tmp_path, monkeypatch):
+    """
+    GIVEN a git command with a short timeout
+    WHEN its output is consumed slower than the timeout
+    THEN no timeout is reported, since only time spent waiting on git counts
+    """
+    repository = _create_repository_with_commit(tmp_path)
+    command = ["show", "HEAD"]
+    expected = git(command, cwd=repository.path)
+    # Read the output in at least 10 chunks
+    monkeypatch.setattr(git_shell, "STREAM_CHUNK_SIZE", len(expected) // 10 + 1)
+
+    timeout = 2
+    chunks = []
+    for chunk in git_stream(command, timeout=timeout, cwd=repository.path):
+        chunks.append(chunk)
+        time.sleep(0.25)
+
+    assert len(chunks) * 0.25 > timeout
+    assert b"".join(chunks).decode() == expected
+
+
 def test_is_git_dir(tmp_path):
     assert is_git_dir(os.getcwd())
     assert not is_git_dir(str(tmp_path))